@@ -2,22 +2,33 @@
 
 import configparser
 import fnmatch
+import importlib.util
 import os
 import re
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
-try:
+
+def _detect_tomllib(
+    find_spec: Callable[[str], object] = importlib.util.find_spec,
+) -> bool:
+    """Return whether tomllib can be located with the given finder."""
+    return find_spec("tomllib") is not None
+
+
+HAS_TOMLLIB = _detect_tomllib()
+
+if HAS_TOMLLIB:
     import tomllib
-    HAS_TOMLLIB = True
-except ImportError:  # pragma: no cover (Python < 3.11)
-    HAS_TOMLLIB = False
 
 VALID_LINTERS: frozenset[str] = frozenset({
     "pylint", "pytest", "mypy", "yamllint", "jscpd", "markdownlint"
 })
 
-DEDICATED_CONFIG_FILES: dict[str, str] = {
+DEDICATED_CONFIG_FILES: Mapping[str, str] = MappingProxyType({
     ".pylintrc": "pylint",
     "pylintrc": "pylint",
     ".pylintrc.toml": "pylint",
@@ -40,73 +51,106 @@ DEDICATED_CONFIG_FILES: dict[str, str] = {
     ".markdownlint.yaml": "markdownlint",
     ".markdownlint.yml": "markdownlint",
     ".markdownlintrc": "markdownlint",
-}
+})
 
-SHARED_CONFIG_SECTIONS: dict[str, dict[str, str]] = {
-    "pylint": {
+SHARED_CONFIG_SECTIONS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "pylint": MappingProxyType({
         "pyproject.toml": "[tool.pylint.*]",
         "setup.cfg": "[pylint.*]",
         "tox.ini": "[pylint.*]",
-    },
-    "pytest": {
+    }),
+    "pytest": MappingProxyType({
         "pyproject.toml": "[tool.pytest.ini_options]",
         "setup.cfg": "[tool:pytest]",
         "tox.ini": "[pytest] or [tool:pytest]",
-    },
-    "mypy": {
+    }),
+    "mypy": MappingProxyType({
         "pyproject.toml": "[tool.mypy]",
         "setup.cfg": "[mypy]",
         "tox.ini": "[mypy]",
-    },
-    "yamllint": {
+    }),
+    "yamllint": MappingProxyType({
         "pyproject.toml": "[tool.yamllint.*]",
-    },
-    "jscpd": {
+    }),
+    "jscpd": MappingProxyType({
         "pyproject.toml": "[tool.jscpd.*]",
-    },
-}
+    }),
+})
 
+PYPROJECT_FALLBACK_PREFIXES: tuple[tuple[str, str, str], ...] = (
+    ("[tool.pylint", "pylint", "tool.pylint section"),
+    ("[tool.mypy]", "mypy", "tool.mypy section"),
+    ("[tool.pytest.ini_options]", "pytest", "tool.pytest.ini_options section"),
+    ("[tool.jscpd", "jscpd", "tool.jscpd section"),
+    ("[tool.yamllint", "yamllint", "tool.yamllint section"),
+)
 
-def get_config_files_for_linters(linters: frozenset[str]) -> dict[str, list[str]]:
+PRUNED_DIRECTORIES: frozenset[str] = frozenset({
+    ".git", ".tox", ".venv", "__pycache__", "node_modules"
+})
+
+SETUP_CFG_SECTIONS: Mapping[str, str] = MappingProxyType({
+    "mypy": "mypy",
+    "tool:pytest": "pytest",
+})
+
+TOX_INI_SECTIONS: Mapping[str, str] = MappingProxyType({
+    "mypy": "mypy",
+    "pytest": "pytest",
+    "tool:pytest": "pytest",
+})
+
+
+@lru_cache(maxsize=32)
+def get_config_files_for_linters(
+    linters: frozenset[str],
+) -> Mapping[str, tuple[str, ...]]:
     """Get the config files that will be checked for each linter.
 
+    Results are cached per linter set and returned read-only.
+
     Args:
         linters: Set of linter names to get config files for.
 
     Returns:
-        Dictionary mapping each linter to its list of config file descriptions.
+        Read-only mapping of each linter to its config file descriptions.
     """
-    result: dict[str, list[str]] = {}
+    result: dict[str, tuple[str, ...]] = {}
 
     for linter in sorted(linters):
-        configs: list[str] = []
-
-        # Add dedicated config files
+        # Dedicated config files first, sorted by filename
         dedicated = sorted(
             filename for filename, tool in DEDICATED_CONFIG_FILES.items()
             if tool == linter
         )
-        configs.extend(dedicated)
 
-        # Add shared config sections
-        if linter in SHARED_CONFIG_SECTIONS:
-            for shared_file, section in SHARED_CONFIG_SECTIONS[linter].items():
-                configs.append(f"{section} in {shared_file}")
+        # Then shared config sections
+        shared = (
+            f"{section} in {shared_file}"
+            for shared_file, section
+            in SHARED_CONFIG_SECTIONS.get(linter, {}).items()
+        )
+
+        result[linter] = (*dedicated, *shared)
 
-        result[linter] = configs
+    return MappingProxyType(result)
 
-    return result
 
+def make_path_relative(path: str, cwd: str | None = None) -> str:
+    """Convert an absolute path to a relative path from cwd.
 
-def make_path_relative(path: str) -> str:
-    """Convert an absolute path to a relative path from cwd."""
+    The process working directory is used unless cwd is given.
+    """
+    if not os.path.isabs(path):
+        return path
+    base = Path.cwd() if cwd is None else Path(cwd)
     try:
-        return str(Path(path).relative_to(Path.cwd()))
+        return str(Path(path).relative_to(base))
     except ValueError:
         return path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     """Represents a detected linter configuration."""
 
@@ -141,8 +185,8 @@ def parse_linters(linters_str: str) -> frozenset[str]:
         ValueError: If any linter name is invalid.
     """
     linters = frozenset(
-        t.strip().lower() for t in linters_str.split(",") if t.strip()
-    )
+        token.strip() for token in linters_str.lower().split(",")
+    ) - {""}
 
     invalid = linters - VALID_LINTERS
     if invalid:
@@ -180,22 +224,16 @@ def _check_pyproject_with_tomllib(
     return findings
 
 
-def _check_pyproject_with_regex(path_str: str, content: str) -> list[Finding]:
-    """Check pyproject.toml content using regex fallback."""
-    findings: list[Finding] = []
-    if re.search(r"^\[tool\.pylint", content, re.MULTILINE):
-        findings.append(Finding(path_str, "pylint", "tool.pylint section"))
-    if re.search(r"^\[tool\.mypy\]", content, re.MULTILINE):
-        findings.append(Finding(path_str, "mypy", "tool.mypy section"))
-    if re.search(r"^\[tool\.pytest\.ini_options\]", content, re.MULTILINE):
-        findings.append(
-            Finding(path_str, "pytest", "tool.pytest.ini_options section")
-        )
-    if re.search(r"^\[tool\.jscpd", content, re.MULTILINE):
-        findings.append(Finding(path_str, "jscpd", "tool.jscpd section"))
-    if re.search(r"^\[tool\.yamllint", content, re.MULTILINE):
-        findings.append(Finding(path_str, "yamllint", "tool.yamllint section"))
-    return findings
+def _check_pyproject_headers(path_str: str, content: str) -> list[Finding]:
+    """Check pyproject.toml content by matching table header prefixes."""
+    headers = [
+        line for line in content.split("\n") if line.startswith("[tool.")
+    ]
+    return [
+        Finding(path_str, tool, reason)
+        for prefix, tool, reason in PYPROJECT_FALLBACK_PREFIXES
+        if any(header.startswith(prefix) for header in headers)
+    ]
 
 
 def check_pyproject_toml(path: Path, content: str) -> list[Finding]:
@@ -210,114 +248,167 @@ def check_pyproject_toml(path: Path, content: str) -> list[Finding]:
         except (tomllib.TOMLDecodeError, ValueError, KeyError, TypeError):
             pass
 
-    return _check_pyproject_with_regex(path_str, content)
+    return _check_pyproject_headers(path_str, content)
 
 
-def check_setup_cfg(path: Path, content: str) -> list[Finding]:
-    """Check setup.cfg for tool-specific sections."""
+def _iter_ini_section_names(content: str) -> Iterator[str]:
+    """Yield INI section header names without splitting content into lines.
+
+    Mirrors configparser's header rule: a stripped line starting with "["
+    whose header runs up to the last "]" on that line.
+    """
+    start = content.find("[")
+    while start != -1:
+        line_start = content.rfind("\n", 0, start) + 1
+        line_end = content.find("\n", start)
+        if line_end == -1:
+            line_end = len(content)
+        if not content[line_start:start].strip():
+            end = content.rfind("]", start, line_end)
+            if end > start + 1:
+                yield content[start + 1:end]
+        start = content.find("[", line_end)
+
+
+def _ini_section_tool(section: str, sections: Mapping[str, str]) -> str | None:
+    """Return the linter owning an INI section, or None if unrelated."""
+    tool = sections.get(section)
+    if tool is None and "pylint" in section.lower():
+        return "pylint"
+    return tool
+
+
+def _check_ini_sections(
+    path: Path, content: str, sections: Mapping[str, str]
+) -> list[Finding]:
+    """Check INI content for sections owned by a linter."""
     findings: list[Finding] = []
     path_str = str(path)
 
-    parser = configparser.ConfigParser()
+    if not any(
+        _ini_section_tool(name, sections)
+        for name in _iter_ini_section_names(content)
+    ):
+        return findings
+
+    # Only section names are read, so skip interpolation and let duplicate
+    # sections or options merge instead of hiding the file's findings.
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
     try:
         parser.read_string(content)
     except configparser.Error:
         return findings
 
     for section in parser.sections():
-        if section == "mypy":
-            findings.append(Finding(path_str, "mypy", "mypy section"))
-        elif section == "tool:pytest":
-            findings.append(Finding(path_str, "pytest", "tool:pytest section"))
-        elif "pylint" in section.lower():
-            findings.append(Finding(path_str, "pylint", f"{section} section"))
+        tool = _ini_section_tool(section, sections)
+        if tool is not None:
+            findings.append(Finding(path_str, tool, f"{section} section"))
 
     return findings
 
 
+def check_setup_cfg(path: Path, content: str) -> list[Finding]:
+    """Check setup.cfg for tool-specific sections."""
+    return _check_ini_sections(path, content, SETUP_CFG_SECTIONS)
+
+
 def check_tox_ini(path: Path, content: str) -> list[Finding]:
     """Check tox.ini for tool-specific sections."""
-    findings: list[Finding] = []
-    path_str = str(path)
-
-    parser = configparser.ConfigParser()
-    try:
-        parser.read_string(content)
-    except configparser.Error:
-        return findings
+    return _check_ini_sections(path, content, TOX_INI_SECTIONS)
 
-    for section in parser.sections():
-        if section in ("pytest", "tool:pytest"):
-            findings.append(Finding(path_str, "pytest", f"{section} section"))
-        elif section == "mypy":
-            findings.append(Finding(path_str, "mypy", "mypy section"))
-        elif "pylint" in section.lower():
-            findings.append(Finding(path_str, "pylint", f"{section} section"))
 
-    return findings
+SHARED_CONFIG_CHECKERS: Mapping[
+    str, Callable[[Path, str], list[Finding]]
+] = MappingProxyType({
+    "pyproject.toml": check_pyproject_toml,
+    "setup.cfg": check_setup_cfg,
+    "tox.ini": check_tox_ini,
+})
 
 
 def _process_shared_config_file(
     file_path: Path, filename: str
 ) -> list[Finding]:
     """Process shared config files (pyproject.toml, setup.cfg, tox.ini)."""
-    content = file_path.read_text(encoding="utf-8")
-    if filename == "pyproject.toml":
-        return check_pyproject_toml(file_path, content)
-    if filename == "setup.cfg":
-        return check_setup_cfg(file_path, content)
-    # filename == "tox.ini"
-    return check_tox_ini(file_path, content)
-
-
-def _matches_exclude_pattern(
-    path: str, exclude_patterns: list[str]
-) -> bool:
-    """Check if path matches any exclude pattern."""
-    for pattern in exclude_patterns:
-        if fnmatch.fnmatch(path, pattern):
-            return True
-    return False
+    checker = SHARED_CONFIG_CHECKERS.get(filename)
+    if checker is None:  # pragma: no cover (scan_directory skips these)
+        return []
+    return checker(file_path, file_path.read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=32)
+def _compile_exclude_patterns(
+    exclude_patterns: tuple[str, ...],
+) -> re.Pattern[str] | None:
+    """Combine glob exclude patterns into one compiled regex, or None."""
+    if not exclude_patterns:
+        return None
+    return re.compile("|".join(
+        fnmatch.translate(os.path.normcase(pattern))
+        for pattern in exclude_patterns
+    ))
+
+
+def _excludes_subtree(prune: re.Pattern[str] | None, dir_path: Path) -> bool:
+    """Check if every path below dir_path matches an exclude pattern.
+
+    Only patterns ending in "*" are compiled into prune: if one matches the
+    directory path plus a separator, its trailing "*" matches anything below.
+    """
+    if prune is None:
+        return False
+    return prune.match(os.path.normcase(os.path.join(dir_path, ""))) is not None
 
 
 def scan_directory(
     directory: Path,
-    linters: frozenset[str],
+    linters: frozenset[str] | None = None,
     exclude_patterns: list[str] | None = None,
 ) -> list[Finding]:
     """Scan a directory recursively for linter configuration files.
 
     Args:
         directory: The directory to scan.
-        linters: Set of linters to check.
+        linters: Set of linters to check. Defaults to all valid linters.
         exclude_patterns: List of glob patterns to exclude paths.
 
     Returns:
         A list of Finding objects for each config found.
     """
-    if exclude_patterns is None:
-        exclude_patterns = []
+    linters = VALID_LINTERS if linters is None else linters
+    exclude_patterns = exclude_patterns or []
+    exclude = _compile_exclude_patterns(tuple(exclude_patterns))
+    prune = _compile_exclude_patterns(
+        tuple(p for p in exclude_patterns if p.endswith("*"))
+    )
 
     findings: list[Finding] = []
-    shared_config_files = {"pyproject.toml", "setup.cfg", "tox.ini"}
 
     for root, dirs, files in os.walk(directory):
-        if ".git" in dirs:
-            dirs.remove(".git")
+        dirs[:] = [
+            d for d in dirs
+            if d not in PRUNED_DIRECTORIES
+            and not _excludes_subtree(prune, Path(root) / d)
+        ]
 
         for filename in files:
+            if (
+                filename not in DEDICATED_CONFIG_FILES
+                and filename not in SHARED_CONFIG_CHECKERS
+            ):
+                continue
             file_path = Path(root) / filename
             path_str = str(file_path)
 
             # Check exclude patterns
-            if _matches_exclude_pattern(path_str, exclude_patterns):
+            if exclude and exclude.match(os.path.normcase(path_str)):
                 continue
 
             if filename in DEDICATED_CONFIG_FILES:
                 tool = DEDICATED_CONFIG_FILES[filename]
                 if tool in linters:
                     findings.append(Finding(path_str, tool, "config file"))
-            elif filename in shared_config_files:
+            else:
                 file_findings = _process_shared_config_file(file_path, filename)
                 # Filter by requested linters
                 findings.extend(f for f in file_findings if f.tool in linters)
@@ -1,12 +1,17 @@
 """Pytest configuration and shared fixtures."""
 
 import sys
+from collections.abc import Mapping
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from assert_no_linter_config_files.cli import main
+from assert_no_linter_config_files.scanner import (
+    VALID_LINTERS,
+    get_config_files_for_linters,
+)
 
 
 PYPROJECT_MYPY_PYLINT_TOML = """
@@ -28,6 +33,34 @@ strict = true
 max-line-length = 100
 """
 
+TOOL_MYPY_TOML = "[tool.mypy]\nstrict = true\n"
+MYPY_INI = "[mypy]\nstrict = True\n"
+
+DEDICATED_CASES: list[tuple[str, str]] = [
+    (".pylintrc", "pylint"),
+    ("pylintrc", "pylint"),
+    (".pylintrc.toml", "pylint"),
+    ("pytest.ini", "pytest"),
+    ("mypy.ini", "mypy"),
+    (".mypy.ini", "mypy"),
+    (".yamllint", "yamllint"),
+    (".yamllint.yml", "yamllint"),
+    (".yamllint.yaml", "yamllint"),
+    (".jscpd.json", "jscpd"),
+    (".jscpd.yml", "jscpd"),
+    (".jscpd.yaml", "jscpd"),
+    (".jscpd.toml", "jscpd"),
+    (".jscpdrc", "jscpd"),
+    (".jscpdrc.json", "jscpd"),
+    (".jscpdrc.yml", "jscpd"),
+    (".jscpdrc.yaml", "jscpd"),
+    (".markdownlint.json", "markdownlint"),
+    (".markdownlint.jsonc", "markdownlint"),
+    (".markdownlint.yaml", "markdownlint"),
+    (".markdownlint.yml", "markdownlint"),
+    (".markdownlintrc", "markdownlint"),
+]
+
 
 def pytest_configure(config: pytest.Config) -> None:
     """Register custom pytest markers."""
@@ -62,13 +95,19 @@ def run_main_with_args():
     return _run_main
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def all_linter_configs() -> Mapping[str, tuple[str, ...]]:
+    """Config files for every valid linter, computed once per module."""
+    return get_config_files_for_linters(VALID_LINTERS)
+
+
+@pytest.fixture(scope="session")
 def pyproject_mypy_pylint_content() -> str:
     """TOML content with [tool.mypy] and [tool.pylint] sections."""
     return PYPROJECT_MYPY_PYLINT_TOML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pyproject_mypy_pylint_with_project_content() -> str:
     """TOML content with [project], [tool.mypy], and [tool.pylint] sections."""
     return PYPROJECT_MYPY_PYLINT_WITH_PROJECT_TOML
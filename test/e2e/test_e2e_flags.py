@@ -166,8 +166,8 @@ class TestExcludeFlag:
     def exclude_repeated_result(
         self, tmp_path: Path
     ) -> subprocess.CompletedProcess[str]:
-        """Run CLI with multiple --exclude on vendor/node_modules/venv."""
-        for name in ["vendor", "node_modules", "venv"]:
+        """Run CLI with multiple --exclude on vendor/third_party/venv."""
+        for name in ["vendor", "third_party", "venv"]:
             subdir = tmp_path / name
             subdir.mkdir()
             (subdir / ".pylintrc").touch()
@@ -175,7 +175,7 @@ class TestExcludeFlag:
         return run_cli(
             "--linters", "pylint,mypy",
             "--exclude", "*vendor*",
-            "--exclude", "*node_modules*",
+            "--exclude", "*third_party*",
             "--exclude", "*venv*",
             str(tmp_path),
         )
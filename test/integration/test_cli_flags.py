@@ -197,6 +197,16 @@ class TestExcludeFlag:
         """--exclude with *third_party* excludes mypy config."""
         assert "mypy" not in exclude_multiple_result[1]
 
+    def test_exclude_file_pattern_exits_0(
+        self, tmp_path: Path, run_main_with_args
+    ) -> None:
+        """--exclude matching a file name rather than a directory exits 0."""
+        (tmp_path / ".pylintrc").touch()
+        code, _, _ = run_main_with_args([
+            "--linters", "pylint", "--exclude", "*/.pylintrc", str(tmp_path)
+        ])
+        assert code == 0
+
 
 @pytest.mark.integration
 class TestOutputModes:
@@ -1,4 +1,4 @@
-"""Integration tests for setup.cfg, tox.ini, .git skipping, and error handling."""
+"""Integration tests for setup.cfg, tox.ini, directory pruning, and errors."""
 
 from pathlib import Path
 
@@ -246,6 +246,18 @@ class TestGitDirectorySkipping:
         ])
         assert stdout == ""
 
+    def test_node_modules_directory_is_skipped_exits_0(
+        self, tmp_path: Path, run_main_with_args
+    ) -> None:
+        """Exit 0 when config files are only inside node_modules."""
+        package_dir = tmp_path / "node_modules" / "some-package"
+        package_dir.mkdir(parents=True)
+        (package_dir / ".markdownlint.json").touch()
+        code, _, _ = run_main_with_args([
+            "--linters", "markdownlint", str(tmp_path)
+        ])
+        assert code == 0
+
 
 @pytest.mark.integration
 def test_oserror_on_file_read_failure_exits_2(
@@ -320,3 +332,35 @@ class TestInvalidConfigFiles:
             "--linters", "pytest", str(tmp_path)
         ])
         assert stdout == ""
+
+    def test_invalid_body_setup_cfg_exits_0(
+        self, tmp_path: Path, run_main_with_args
+    ) -> None:
+        """Exit 0 when setup.cfg has a linter header but invalid body."""
+        content = "[mypy]\nnot an option line\n"
+        (tmp_path / "setup.cfg").write_text(content)
+        code, _, _ = run_main_with_args([
+            "--linters", "mypy", str(tmp_path)
+        ])
+        assert code == 0
+
+    def test_invalid_body_tox_ini_exits_0(
+        self, tmp_path: Path, run_main_with_args
+    ) -> None:
+        """Exit 0 when tox.ini has a linter header but invalid body."""
+        content = "[pytest]\nnot an option line\n"
+        (tmp_path / "tox.ini").write_text(content)
+        code, _, _ = run_main_with_args([
+            "--linters", "pytest", str(tmp_path)
+        ])
+        assert code == 0
+
+    def test_header_without_trailing_newline_exits_1(
+        self, tmp_path: Path, run_main_with_args
+    ) -> None:
+        """Exit 1 when tox.ini ends in a linter header with no newline."""
+        (tmp_path / "tox.ini").write_text("[tox]\n[pytest]")
+        code, _, _ = run_main_with_args([
+            "--linters", "pytest", str(tmp_path)
+        ])
+        assert code == 1
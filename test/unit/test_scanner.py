@@ -1,12 +1,12 @@
 """Unit tests for the scanner module - config file detection."""
 
 from pathlib import Path
+from test.conftest import DEDICATED_CASES, MYPY_INI, TOOL_MYPY_TOML
 
 import pytest
 
 from assert_no_linter_config_files.scanner import (
-    DEDICATED_CONFIG_FILES,
-    VALID_LINTERS,
+    PRUNED_DIRECTORIES,
     Finding,
     check_pyproject_toml,
     check_setup_cfg,
@@ -15,384 +15,166 @@ from assert_no_linter_config_files.scanner import (
     scan_directory,
 )
 
-ALL_DEDICATED_FILENAMES: list[str] = sorted(DEDICATED_CONFIG_FILES.keys())
+PYTEST_INI = "[pytest]\naddopts = -v\n"
+TOOL_PYTEST_INI = "[tool:pytest]\naddopts = -v\n"
+
+MYPY_FINDING = Finding("./mypy.ini", "mypy", "config file")
+
+
+@pytest.fixture(scope="module", name="findings_by_filename")
+def dedicated_findings_by_filename(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[str, list[tuple[str, str]]]:
+    """Scan one tree holding every dedicated config file."""
+    root = tmp_path_factory.mktemp("dedicated")
+    for filename, _ in DEDICATED_CASES:
+        (root / filename).write_bytes(b"")
+    result: dict[str, list[tuple[str, str]]] = {}
+    for finding in scan_directory(root):
+        result.setdefault(Path(finding.path).name, []).append(
+            (finding.tool, finding.reason)
+        )
+    return result
 
 
 @pytest.mark.unit
 class TestDedicatedConfigFiles:
     """Tests for detecting dedicated config files."""
 
-    @pytest.mark.parametrize("filename", ALL_DEDICATED_FILENAMES)
-    def test_dedicated_config_file_returns_one_finding(
-        self, tmp_path: Path, filename: str
-    ) -> None:
-        """Dedicated config files produce exactly one finding."""
-        (tmp_path / filename).touch()
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert len(findings) == 1
-
-    @pytest.mark.parametrize(
-        "filename,expected_tool",
-        [
-            (".pylintrc", "pylint"),
-            ("pylintrc", "pylint"),
-            (".pylintrc.toml", "pylint"),
-            ("pytest.ini", "pytest"),
-            ("mypy.ini", "mypy"),
-            (".mypy.ini", "mypy"),
-            (".yamllint", "yamllint"),
-            (".yamllint.yml", "yamllint"),
-            (".yamllint.yaml", "yamllint"),
-            (".jscpd.json", "jscpd"),
-            (".jscpd.yml", "jscpd"),
-            (".jscpd.yaml", "jscpd"),
-            (".jscpd.toml", "jscpd"),
-            (".jscpdrc", "jscpd"),
-            (".jscpdrc.json", "jscpd"),
-            (".jscpdrc.yml", "jscpd"),
-            (".jscpdrc.yaml", "jscpd"),
-            (".markdownlint.json", "markdownlint"),
-            (".markdownlint.jsonc", "markdownlint"),
-            (".markdownlint.yaml", "markdownlint"),
-            (".markdownlint.yml", "markdownlint"),
-            (".markdownlintrc", "markdownlint"),
-        ],
-    )
-    def test_dedicated_config_file_has_correct_tool(
-        self, tmp_path: Path, filename: str, expected_tool: str
-    ) -> None:
-        """Dedicated config files report the correct tool."""
-        (tmp_path / filename).touch()
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert findings[0].tool == expected_tool
-
-    @pytest.mark.parametrize("filename", ALL_DEDICATED_FILENAMES)
-    def test_dedicated_config_file_has_config_file_reason(
-        self, tmp_path: Path, filename: str
+    @pytest.mark.parametrize("filename,expected_tool", DEDICATED_CASES)
+    def test_dedicated_config_file_produces_one_finding(
+        self,
+        findings_by_filename: dict[str, list[tuple[str, str]]],
+        filename: str,
+        expected_tool: str,
     ) -> None:
-        """Dedicated config files report 'config file' as reason."""
-        (tmp_path / filename).touch()
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert findings[0].reason == "config file"
+        """Dedicated config files produce one 'config file' finding."""
+        assert findings_by_filename.get(filename) == [
+            (expected_tool, "config file")
+        ]
 
     def test_no_findings_for_unrelated_files(self, tmp_path: Path) -> None:
         """Unrelated files are not flagged."""
-        (tmp_path / "README.md").touch()
-        (tmp_path / "main.py").touch()
-        (tmp_path / ".gitignore").touch()
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
+        (tmp_path / "README.md").write_bytes(b"")
+        (tmp_path / "main.py").write_bytes(b"")
+        (tmp_path / ".gitignore").write_bytes(b"")
+        findings = scan_directory(tmp_path)
         assert len(findings) == 0
 
 
 @pytest.mark.unit
-class TestPyprojectTomlPylintMypy:
-    """Tests for pyproject.toml pylint and mypy section detection."""
-
-    def test_tool_pylint_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.pylint] section returns one finding."""
-        content = "[tool.pylint]\nmax-line-length = 100\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert len(findings) == 1
-
-    def test_tool_pylint_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.pylint] section reports pylint tool."""
-        content = "[tool.pylint]\nmax-line-length = 100\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert findings[0].tool == "pylint"
+class TestPyprojectToml:
+    """Tests for pyproject.toml tool section detection."""
 
-    def test_tool_pylint_section_has_correct_reason(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.pylint] section reports tool.pylint in reason."""
-        content = "[tool.pylint]\nmax-line-length = 100\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert "tool.pylint" in findings[0].reason
-
-    def test_tool_pylint_subsection_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.pylint.messages_control] returns one finding."""
-        content = "[tool.pylint.messages_control]\ndisable = ['C0114']\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert len(findings) == 1
-
-    def test_tool_pylint_subsection_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.pylint.messages_control] reports pylint."""
-        content = "[tool.pylint.messages_control]\ndisable = ['C0114']\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert findings[0].tool == "pylint"
-
-    def test_tool_mypy_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.mypy] section returns one finding."""
-        content = "[tool.mypy]\nstrict = true\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert len(findings) == 1
-
-    def test_tool_mypy_section_has_correct_tool(
-        self, tmp_path: Path
+    @pytest.mark.parametrize(
+        "content,expected_tool,expected_reason",
+        [
+            (
+                "[tool.pylint]\nmax-line-length = 100\n",
+                "pylint",
+                "tool.pylint section",
+            ),
+            (
+                "[tool.pylint.messages_control]\ndisable = ['C0114']\n",
+                "pylint",
+                "tool.pylint section",
+            ),
+            (TOOL_MYPY_TOML, "mypy", "tool.mypy section"),
+            (
+                "[tool.pytest.ini_options]\naddopts = '-v'\n",
+                "pytest",
+                "tool.pytest.ini_options section",
+            ),
+            ("[tool.jscpd]\nthreshold = 0\n", "jscpd", "tool.jscpd section"),
+            (
+                "[tool.yamllint]\nrules = {}\n",
+                "yamllint",
+                "tool.yamllint section",
+            ),
+        ],
+    )
+    def test_tool_section_produces_one_finding(
+        self,
+        content: str,
+        expected_tool: str,
+        expected_reason: str,
     ) -> None:
-        """Detect [tool.mypy] section reports mypy tool."""
-        content = "[tool.mypy]\nstrict = true\n"
+        """Each linter tool section produces one matching finding."""
         findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
+            Path("pyproject.toml"), content
         )
-        assert findings[0].tool == "mypy"
+        assert [(f.tool, f.reason) for f in findings] == [
+            (expected_tool, expected_reason)
+        ]
 
-    def test_tool_mypy_section_has_correct_reason(
-        self, tmp_path: Path
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "[tool.black]\nline-length = 88\n",
+            "[tool.pytest]\nmarkers = ['slow']\n",
+        ],
+    )
+    def test_unrelated_section_not_flagged(
+        self, content: str
     ) -> None:
-        """Detect [tool.mypy] section reports tool.mypy in reason."""
-        content = "[tool.mypy]\nstrict = true\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert "tool.mypy" in findings[0].reason
-
-    def test_no_findings_for_other_tools(self, tmp_path: Path) -> None:
-        """Other tool sections are not flagged."""
-        content = "[tool.black]\nline-length = 88\n"
+        """Other tools and [tool.pytest] without ini_options are ignored."""
         findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
+            Path("pyproject.toml"), content
         )
         assert len(findings) == 0
 
-    def test_multiple_sections_returns_two_findings(
-        self, tmp_path: Path, pyproject_mypy_pylint_content: str
+    def test_multiple_sections_report_each_tool(
+        self, pyproject_mypy_pylint_content: str
     ) -> None:
-        """Multiple tool sections produce two findings."""
+        """Multiple tool sections produce one finding per tool."""
         findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml",
+            Path("pyproject.toml"),
             pyproject_mypy_pylint_content,
         )
-        assert len(findings) == 2
-
-    def test_multiple_sections_has_correct_tools(
-        self, tmp_path: Path, pyproject_mypy_pylint_content: str
-    ) -> None:
-        """Multiple tool sections report the correct tools."""
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml",
-            pyproject_mypy_pylint_content,
-        )
-        tools = {f.tool for f in findings}
-        assert tools == {"mypy", "pylint"}
-
-
-@pytest.mark.unit
-class TestPyprojectTomlOtherTools:
-    """Tests for pyproject.toml pytest, jscpd, yamllint detection."""
-
-    def test_tool_pytest_ini_options_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.pytest.ini_options] returns one finding."""
-        content = "[tool.pytest.ini_options]\naddopts = '-v'\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert len(findings) == 1
-
-    def test_tool_pytest_ini_options_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.pytest.ini_options] reports pytest tool."""
-        content = "[tool.pytest.ini_options]\naddopts = '-v'\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert findings[0].tool == "pytest"
-
-    def test_tool_pytest_ini_options_has_correct_reason(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.pytest.ini_options] reports correct reason."""
-        content = "[tool.pytest.ini_options]\naddopts = '-v'\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert "tool.pytest.ini_options" in findings[0].reason
-
-    def test_tool_pytest_without_ini_options_not_flagged(
-        self, tmp_path: Path
-    ) -> None:
-        """[tool.pytest] without ini_options is not flagged."""
-        content = "[tool.pytest]\nmarkers = ['slow']\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert len(findings) == 0
-
-    def test_tool_jscpd_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.jscpd] section returns one finding."""
-        content = "[tool.jscpd]\nthreshold = 0\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert len(findings) == 1
-
-    def test_tool_jscpd_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.jscpd] section reports jscpd tool."""
-        content = "[tool.jscpd]\nthreshold = 0\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert findings[0].tool == "jscpd"
-
-    def test_tool_jscpd_section_has_correct_reason(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.jscpd] section reports tool.jscpd in reason."""
-        content = "[tool.jscpd]\nthreshold = 0\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert "tool.jscpd" in findings[0].reason
-
-    def test_tool_yamllint_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.yamllint] section returns one finding."""
-        content = "[tool.yamllint]\nrules = {}\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert len(findings) == 1
-
-    def test_tool_yamllint_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.yamllint] section reports yamllint tool."""
-        content = "[tool.yamllint]\nrules = {}\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert findings[0].tool == "yamllint"
-
-    def test_tool_yamllint_section_has_correct_reason(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool.yamllint] section reports reason."""
-        content = "[tool.yamllint]\nrules = {}\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert "tool.yamllint" in findings[0].reason
+        assert sorted(f.tool for f in findings) == ["mypy", "pylint"]
 
 
 @pytest.mark.unit
 class TestSetupCfg:
     """Tests for setup.cfg section detection."""
 
-    def test_mypy_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [mypy] section returns one finding."""
-        content = "[mypy]\nstrict = True\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert len(findings) == 1
-
-    def test_mypy_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [mypy] section reports mypy tool."""
-        content = "[mypy]\nstrict = True\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert findings[0].tool == "mypy"
-
-    def test_mypy_section_has_correct_reason(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [mypy] section reports mypy section in reason."""
-        content = "[mypy]\nstrict = True\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert "mypy section" in findings[0].reason
-
-    def test_tool_pytest_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool:pytest] section returns one finding."""
-        content = "[tool:pytest]\naddopts = -v\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert len(findings) == 1
-
-    def test_tool_pytest_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool:pytest] section reports pytest tool."""
-        content = "[tool:pytest]\naddopts = -v\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert findings[0].tool == "pytest"
-
-    def test_tool_pytest_section_has_correct_reason(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool:pytest] section reports tool:pytest in reason."""
-        content = "[tool:pytest]\naddopts = -v\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert "tool:pytest" in findings[0].reason
-
-    def test_pylint_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect section containing 'pylint' returns one finding."""
-        content = "[pylint.messages_control]\ndisable = C0114\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert len(findings) == 1
-
-    def test_pylint_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect section containing 'pylint' reports pylint tool."""
-        content = "[pylint.messages_control]\ndisable = C0114\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert findings[0].tool == "pylint"
-
-    def test_pylint_master_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [pylint.master] section returns one finding."""
-        content = "[pylint.master]\njobs = 4\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert len(findings) == 1
-
-    def test_pylint_master_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [pylint.master] section reports pylint tool."""
-        content = "[pylint.master]\njobs = 4\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert findings[0].tool == "pylint"
+    @pytest.mark.parametrize(
+        "content,expected_tool,expected_reason",
+        [
+            (MYPY_INI, "mypy", "mypy section"),
+            (TOOL_PYTEST_INI, "pytest", "tool:pytest section"),
+            (
+                "[pylint.messages_control]\ndisable = C0114\n",
+                "pylint",
+                "pylint.messages_control section",
+            ),
+            ("[pylint.master]\njobs = 4\n", "pylint", "pylint.master section"),
+        ],
+    )
+    def test_linter_section_produces_one_finding(
+        self,
+        content: str,
+        expected_tool: str,
+        expected_reason: str,
+    ) -> None:
+        """Each linter section produces one matching finding."""
+        findings = check_setup_cfg(Path("setup.cfg"), content)
+        assert [(f.tool, f.reason) for f in findings] == [
+            (expected_tool, expected_reason)
+        ]
 
-    def test_no_findings_for_other_sections(
-        self, tmp_path: Path
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "[metadata]\nname = mypackage\n",
+            PYTEST_INI,
+        ],
+    )
+    def test_unrelated_section_not_flagged(
+        self, content: str
     ) -> None:
-        """Other sections are not flagged."""
-        content = "[metadata]\nname = mypackage\n"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
+        """Other sections, including bare [pytest], are not flagged."""
+        findings = check_setup_cfg(Path("setup.cfg"), content)
         assert len(findings) == 0
 
 
@@ -400,92 +182,31 @@ class TestSetupCfg:
 class TestToxIni:
     """Tests for tox.ini section detection."""
 
-    def test_pytest_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [pytest] section returns one finding."""
-        content = "[pytest]\naddopts = -v\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert len(findings) == 1
-
-    def test_pytest_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [pytest] section reports pytest tool."""
-        content = "[pytest]\naddopts = -v\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert findings[0].tool == "pytest"
-
-    def test_pytest_section_has_correct_reason(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [pytest] section reports pytest section in reason."""
-        content = "[pytest]\naddopts = -v\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert "pytest section" in findings[0].reason
-
-    def test_tool_pytest_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool:pytest] section returns one finding."""
-        content = "[tool:pytest]\naddopts = -v\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert len(findings) == 1
-
-    def test_tool_pytest_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [tool:pytest] section reports pytest tool."""
-        content = "[tool:pytest]\naddopts = -v\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert findings[0].tool == "pytest"
-
-    def test_mypy_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [mypy] section returns one finding."""
-        content = "[mypy]\nstrict = True\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert len(findings) == 1
-
-    def test_mypy_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [mypy] section reports mypy tool."""
-        content = "[mypy]\nstrict = True\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert findings[0].tool == "mypy"
-
-    def test_mypy_section_has_correct_reason(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect [mypy] section reports mypy section in reason."""
-        content = "[mypy]\nstrict = True\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert "mypy section" in findings[0].reason
-
-    def test_pylint_section_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect section containing 'pylint' returns one finding."""
-        content = "[pylint]\ndisable = C0114\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert len(findings) == 1
-
-    def test_pylint_section_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Detect section containing 'pylint' reports pylint tool."""
-        content = "[pylint]\ndisable = C0114\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert findings[0].tool == "pylint"
-
-    def test_no_findings_for_tox_sections(
-        self, tmp_path: Path
-    ) -> None:
+    @pytest.mark.parametrize(
+        "content,expected_tool,expected_reason",
+        [
+            (PYTEST_INI, "pytest", "pytest section"),
+            (TOOL_PYTEST_INI, "pytest", "tool:pytest section"),
+            (MYPY_INI, "mypy", "mypy section"),
+            ("[pylint]\ndisable = C0114\n", "pylint", "pylint section"),
+        ],
+    )
+    def test_linter_section_produces_one_finding(
+        self,
+        content: str,
+        expected_tool: str,
+        expected_reason: str,
+    ) -> None:
+        """Each linter section produces one matching finding."""
+        findings = check_tox_ini(Path("tox.ini"), content)
+        assert [(f.tool, f.reason) for f in findings] == [
+            (expected_tool, expected_reason)
+        ]
+
+    def test_no_findings_for_tox_sections(self) -> None:
         """Tox-specific sections are not flagged."""
         content = "[tox]\nenvlist = py310,py311\n\n[testenv]\ndeps = pytest\n"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
+        findings = check_tox_ini(Path("tox.ini"), content)
         assert len(findings) == 0
 
 
@@ -497,83 +218,48 @@ class TestScanDirectory:
         """The .git directory is skipped."""
         git_dir = tmp_path / ".git"
         git_dir.mkdir()
-        (git_dir / ".pylintrc").touch()
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
+        (git_dir / ".pylintrc").write_bytes(b"")
+        findings = scan_directory(tmp_path)
         assert len(findings) == 0
 
-    def test_recursive_scan_returns_one_finding(
-        self, tmp_path: Path
+    @pytest.mark.parametrize("dirname", sorted(PRUNED_DIRECTORIES))
+    def test_skips_pruned_directory(
+        self, tmp_path: Path, dirname: str
     ) -> None:
-        """Subdirectories are scanned recursively."""
-        subdir = tmp_path / "subdir" / "nested"
-        subdir.mkdir(parents=True)
-        (subdir / "pytest.ini").touch()
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert len(findings) == 1
+        """Pruned directories are not descended into."""
+        pruned_dir = tmp_path / "subdir" / dirname
+        pruned_dir.mkdir(parents=True)
+        (pruned_dir / ".pylintrc").write_bytes(b"")
+        findings = scan_directory(tmp_path)
+        assert len(findings) == 0
 
-    def test_recursive_scan_has_correct_tool(
+    def test_recursive_scan_finds_nested_config(
         self, tmp_path: Path
     ) -> None:
-        """Subdirectories report the correct tool."""
+        """Subdirectories are scanned recursively."""
         subdir = tmp_path / "subdir" / "nested"
         subdir.mkdir(parents=True)
-        (subdir / "pytest.ini").touch()
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert findings[0].tool == "pytest"
-
-    def test_pyproject_toml_scanned_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """pyproject.toml is scanned and produces one finding."""
-        content = "[tool.mypy]\nstrict = true\n"
-        (tmp_path / "pyproject.toml").write_text(content)
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert len(findings) == 1
-
-    def test_pyproject_toml_scanned_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """pyproject.toml is scanned and reports the correct tool."""
-        content = "[tool.mypy]\nstrict = true\n"
-        (tmp_path / "pyproject.toml").write_text(content)
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert findings[0].tool == "mypy"
-
-    def test_setup_cfg_scanned_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """setup.cfg is scanned and produces one finding."""
-        content = "[mypy]\nstrict = True\n"
-        (tmp_path / "setup.cfg").write_text(content)
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert len(findings) == 1
-
-    def test_setup_cfg_scanned_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """setup.cfg is scanned and reports the correct tool."""
-        content = "[mypy]\nstrict = True\n"
-        (tmp_path / "setup.cfg").write_text(content)
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert findings[0].tool == "mypy"
-
-    def test_tox_ini_scanned_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """tox.ini is scanned and produces one finding."""
-        content = "[pytest]\naddopts = -v\n"
-        (tmp_path / "tox.ini").write_text(content)
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert len(findings) == 1
-
-    def test_tox_ini_scanned_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """tox.ini is scanned and reports the correct tool."""
-        content = "[pytest]\naddopts = -v\n"
-        (tmp_path / "tox.ini").write_text(content)
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
-        assert findings[0].tool == "pytest"
+        (subdir / "pytest.ini").write_bytes(b"")
+        findings = scan_directory(tmp_path)
+        assert [f.tool for f in findings] == ["pytest"]
+
+    def test_dedicated_config_file_not_read(self, tmp_path: Path) -> None:
+        """Dedicated config files are reported from their name alone."""
+        (tmp_path / "mypy.ini").symlink_to(tmp_path / "missing")
+        findings = scan_directory(tmp_path)
+        assert [f.tool for f in findings] == ["mypy"]
+
+    def test_shared_config_files_scanned(self, tmp_path: Path) -> None:
+        """pyproject.toml, setup.cfg, and tox.ini are all scanned."""
+        (tmp_path / "pyproject.toml").write_text(TOOL_MYPY_TOML)
+        (tmp_path / "setup.cfg").write_text(MYPY_INI)
+        (tmp_path / "tox.ini").write_text(PYTEST_INI)
+        findings = scan_directory(tmp_path)
+        assert sorted((Path(f.path).name, f.tool) for f in findings) == [
+            ("pyproject.toml", "mypy"),
+            ("setup.cfg", "mypy"),
+            ("tox.ini", "pytest"),
+        ]
 
     def test_pyproject_toml_without_tool_sections(
         self, tmp_path: Path
@@ -581,12 +267,12 @@ class TestScanDirectory:
         """pyproject.toml without tool sections is not flagged."""
         content = "[project]\nname = 'myproject'\n"
         (tmp_path / "pyproject.toml").write_text(content)
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
+        findings = scan_directory(tmp_path)
         assert len(findings) == 0
 
     def test_empty_directory(self, tmp_path: Path) -> None:
         """Empty directory returns no findings."""
-        findings = scan_directory(tmp_path, linters=VALID_LINTERS)
+        findings = scan_directory(tmp_path)
         assert len(findings) == 0
 
 
@@ -601,35 +287,38 @@ class TestFinding:
 
     def test_namedtuple_has_correct_path(self) -> None:
         """Finding has correct path field."""
-        finding = Finding("./mypy.ini", "mypy", "config file")
-        assert finding.path == "./mypy.ini"
+        assert MYPY_FINDING.path == "./mypy.ini"
 
     def test_namedtuple_has_correct_tool(self) -> None:
         """Finding has correct tool field."""
-        finding = Finding("./mypy.ini", "mypy", "config file")
-        assert finding.tool == "mypy"
+        assert MYPY_FINDING.tool == "mypy"
 
     def test_namedtuple_has_correct_reason(self) -> None:
         """Finding has correct reason field."""
-        finding = Finding("./mypy.ini", "mypy", "config file")
-        assert finding.reason == "config file"
+        assert MYPY_FINDING.reason == "config file"
+
+    def test_has_no_instance_dict(self) -> None:
+        """Finding uses slots rather than a per-instance __dict__."""
+        assert not hasattr(MYPY_FINDING, "__dict__")
 
 
 @pytest.mark.unit
 class TestMakePathRelative:
     """Tests for the make_path_relative function."""
 
-    def test_relative_path(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_relative_path(self) -> None:
         """Absolute paths are converted to relative."""
-        monkeypatch.chdir(tmp_path)
-        subdir = tmp_path / "subdir"
-        subdir.mkdir()
-        result = make_path_relative(str(subdir / "file.txt"))
+        result = make_path_relative(
+            "/project/subdir/file.txt", cwd="/project"
+        )
         assert result == "subdir/file.txt"
 
     def test_path_outside_cwd(self) -> None:
         """Paths outside cwd are returned unchanged."""
         result = make_path_relative("/some/absolute/path")
         assert result == "/some/absolute/path"
+
+    def test_relative_path_unchanged(self) -> None:
+        """Paths that are already relative are returned unchanged."""
+        result = make_path_relative("subdir/pytest.ini")
+        assert result == "subdir/pytest.ini"
@@ -1,19 +1,25 @@
 """Unit tests for the scanner module - mappings, filters, and fallbacks."""
 
-import builtins
-import importlib
-import sys
+import itertools
+import os
+from collections import Counter
+from collections.abc import Iterator, Mapping
 from pathlib import Path
-from unittest.mock import patch
+from test.conftest import DEDICATED_CASES, MYPY_INI, TOOL_MYPY_TOML
+from types import MappingProxyType
 
 import pytest
 
+from assert_no_linter_config_files import scanner
 from assert_no_linter_config_files.scanner import (
     DEDICATED_CONFIG_FILES,
     SHARED_CONFIG_SECTIONS,
     VALID_LINTERS,
     Finding,
-    _check_pyproject_with_regex,
+    _check_pyproject_headers,
+    _compile_exclude_patterns,
+    _detect_tomllib,
+    _iter_ini_section_names,
     _process_shared_config_file,
     check_pyproject_toml,
     check_setup_cfg,
@@ -23,61 +29,52 @@ from assert_no_linter_config_files.scanner import (
     scan_directory,
 )
 
+TOOL_PYLINT_TOML = "[tool.pylint]\nmax-line-length = 100\n"
+TOOL_PYTEST_TOML = "[tool.pytest.ini_options]\naddopts = '-v'\n"
+TOOL_JSCPD_TOML = "[tool.jscpd]\nthreshold = 0\n"
+TOOL_YAMLLINT_TOML = "[tool.yamllint]\nrules = {}\n"
+INVALID_MYPY_TOML = "[tool.mypy]\nstrict = {\n"
+UNCLOSED_HEADER_INI = "[section\nmissing closing bracket"
+
+PYLINT_ONLY: frozenset[str] = frozenset({"pylint"})
+MYPY_ONLY: frozenset[str] = frozenset({"mypy"})
+YAMLLINT_ONLY: frozenset[str] = frozenset({"yamllint"})
+MARKDOWNLINT_ONLY: frozenset[str] = frozenset({"markdownlint"})
+PYLINT_AND_MYPY: frozenset[str] = frozenset({"pylint", "mypy"})
+PYLINT_MYPY_PYTEST: frozenset[str] = frozenset({"pylint", "mypy", "pytest"})
+PYLINT_MYPY_YAMLLINT: frozenset[str] = frozenset(
+    {"pylint", "mypy", "yamllint"}
+)
+
+DEDICATED_COUNTS: Counter[str] = Counter(DEDICATED_CONFIG_FILES.values())
+JSCPD_FILES: tuple[str, ...] = tuple(
+    f for f in DEDICATED_CONFIG_FILES if "jscpd" in f
+)
+MARKDOWNLINT_FILES: tuple[str, ...] = tuple(
+    f for f in DEDICATED_CONFIG_FILES if "markdownlint" in f
+)
+
 
 @pytest.mark.unit
 class TestDedicatedConfigFilesMapping:
     """Tests for the DEDICATED_CONFIG_FILES mapping."""
 
-    @pytest.mark.parametrize(
-        "filename",
-        [".pylintrc", "pylintrc", ".pylintrc.toml"],
-    )
-    def test_pylint_file_maps_to_pylint(self, filename: str) -> None:
-        """Pylint config file maps to pylint."""
-        assert DEDICATED_CONFIG_FILES[filename] == "pylint"
+    def test_mapping_is_read_only(self) -> None:
+        """DEDICATED_CONFIG_FILES cannot be mutated at runtime."""
+        assert isinstance(DEDICATED_CONFIG_FILES, MappingProxyType)
 
-    @pytest.mark.parametrize(
-        "filename",
-        ["pytest.ini"],
-    )
-    def test_pytest_file_maps_to_pytest(self, filename: str) -> None:
-        """Pytest config file maps to pytest."""
-        assert DEDICATED_CONFIG_FILES[filename] == "pytest"
-
-    @pytest.mark.parametrize(
-        "filename",
-        ["mypy.ini", ".mypy.ini"],
-    )
-    def test_mypy_file_maps_to_mypy(self, filename: str) -> None:
-        """Mypy config file maps to mypy."""
-        assert DEDICATED_CONFIG_FILES[filename] == "mypy"
-
-    @pytest.mark.parametrize(
-        "filename",
-        [".yamllint", ".yamllint.yml", ".yamllint.yaml"],
-    )
-    def test_yamllint_file_maps_to_yamllint(
-        self, filename: str
+    @pytest.mark.parametrize("filename,expected_tool", DEDICATED_CASES)
+    def test_filename_maps_to_tool(
+        self, filename: str, expected_tool: str
     ) -> None:
-        """Yamllint config file maps to yamllint."""
-        assert DEDICATED_CONFIG_FILES[filename] == "yamllint"
+        """Dedicated config file maps to its linter."""
+        assert DEDICATED_CONFIG_FILES[filename] == expected_tool
 
     def test_markdownlint_has_five_dedicated_files(self) -> None:
         """There are exactly five markdownlint dedicated config files."""
-        markdownlint_count = sum(
-            1 for tool in DEDICATED_CONFIG_FILES.values()
-            if tool == "markdownlint"
-        )
-        assert markdownlint_count == 5
+        assert DEDICATED_COUNTS["markdownlint"] == 5
 
-    @pytest.mark.parametrize(
-        "filename",
-        [
-            f
-            for f in DEDICATED_CONFIG_FILES
-            if "markdownlint" in f
-        ],
-    )
+    @pytest.mark.parametrize("filename", MARKDOWNLINT_FILES)
     def test_markdownlint_filename_maps_to_markdownlint(
         self, filename: str
     ) -> None:
@@ -86,20 +83,9 @@ class TestDedicatedConfigFilesMapping:
 
     def test_jscpd_has_eight_dedicated_files(self) -> None:
         """There are exactly eight jscpd dedicated config files."""
-        jscpd_count = sum(
-            1 for tool in DEDICATED_CONFIG_FILES.values()
-            if tool == "jscpd"
-        )
-        assert jscpd_count == 8
+        assert DEDICATED_COUNTS["jscpd"] == 8
 
-    @pytest.mark.parametrize(
-        "filename",
-        [
-            f
-            for f in DEDICATED_CONFIG_FILES
-            if "jscpd" in f
-        ],
-    )
+    @pytest.mark.parametrize("filename", JSCPD_FILES)
     def test_jscpd_filename_maps_to_jscpd(
         self, filename: str
     ) -> None:
@@ -111,160 +97,100 @@ class TestDedicatedConfigFilesMapping:
 class TestGetConfigFilesForLinters:
     """Tests for the get_config_files_for_linters function."""
 
-    def test_single_linter_contains_pylint_key(self) -> None:
-        """Single linter result contains pylint key."""
-        result = get_config_files_for_linters(frozenset({"pylint"}))
-        assert "pylint" in result
-
-    def test_single_linter_contains_pylintrc(self) -> None:
-        """Single linter result contains .pylintrc."""
-        result = get_config_files_for_linters(frozenset({"pylint"}))
-        assert ".pylintrc" in result["pylint"]
-
-    def test_single_linter_contains_pylintrc_no_dot(self) -> None:
-        """Single linter result contains pylintrc."""
-        result = get_config_files_for_linters(frozenset({"pylint"}))
-        assert "pylintrc" in result["pylint"]
-
-    def test_single_linter_contains_pylintrc_toml(self) -> None:
-        """Single linter result contains .pylintrc.toml."""
-        result = get_config_files_for_linters(frozenset({"pylint"}))
-        assert ".pylintrc.toml" in result["pylint"]
-
-    def test_single_linter_shared_contains_mypy_key(self) -> None:
-        """Single linter result contains mypy key."""
-        result = get_config_files_for_linters(frozenset({"mypy"}))
-        assert "mypy" in result
-
-    def test_single_linter_shared_contains_pyproject(self) -> None:
-        """Single linter contains pyproject.toml shared section."""
-        result = get_config_files_for_linters(frozenset({"mypy"}))
-        assert "[tool.mypy] in pyproject.toml" in result["mypy"]
-
-    def test_single_linter_shared_contains_setup_cfg(self) -> None:
-        """Single linter contains setup.cfg shared section."""
-        result = get_config_files_for_linters(frozenset({"mypy"}))
-        assert "[mypy] in setup.cfg" in result["mypy"]
-
-    def test_single_linter_shared_contains_tox_ini(self) -> None:
-        """Single linter contains tox.ini shared section."""
-        result = get_config_files_for_linters(frozenset({"mypy"}))
-        assert "[mypy] in tox.ini" in result["mypy"]
-
-    def test_multiple_linters_returns_correct_count(self) -> None:
-        """Multiple linters returns correct count."""
-        result = get_config_files_for_linters(
-            frozenset({"pylint", "mypy"})
-        )
-        assert len(result) == 2
-
-    def test_multiple_linters_contains_pylint(self) -> None:
-        """Multiple linters result contains pylint."""
-        result = get_config_files_for_linters(
-            frozenset({"pylint", "mypy"})
-        )
-        assert "pylint" in result
+    @pytest.mark.parametrize(
+        "linters,expected_keys",
+        [
+            pytest.param(PYLINT_ONLY, ["pylint"], id="pylint"),
+            pytest.param(MYPY_ONLY, ["mypy"], id="mypy"),
+            pytest.param(YAMLLINT_ONLY, ["yamllint"], id="yamllint"),
+            pytest.param(
+                MARKDOWNLINT_ONLY, ["markdownlint"], id="markdownlint"
+            ),
+            pytest.param(
+                PYLINT_AND_MYPY, ["mypy", "pylint"], id="pylint+mypy"
+            ),
+        ],
+    )
+    def test_result_keys_match_requested_linters(
+        self, linters: frozenset[str], expected_keys: list[str]
+    ) -> None:
+        """The result has exactly one key per requested linter."""
+        result = get_config_files_for_linters(linters)
+        assert list(result) == expected_keys
 
-    def test_multiple_linters_contains_mypy(self) -> None:
-        """Multiple linters result contains mypy."""
-        result = get_config_files_for_linters(
-            frozenset({"pylint", "mypy"})
-        )
-        assert "mypy" in result
+    @pytest.mark.parametrize(
+        "linter,expected",
+        [
+            ("pylint", ".pylintrc"),
+            ("pylint", "pylintrc"),
+            ("pylint", ".pylintrc.toml"),
+            ("mypy", "[tool.mypy] in pyproject.toml"),
+            ("mypy", "[mypy] in setup.cfg"),
+            ("mypy", "[mypy] in tox.ini"),
+            ("yamllint", ".yamllint"),
+            ("yamllint", "[tool.yamllint.*] in pyproject.toml"),
+            ("markdownlint", ".markdownlint.json"),
+            ("markdownlint", ".markdownlint.jsonc"),
+            ("markdownlint", ".markdownlint.yml"),
+            ("markdownlint", ".markdownlint.yaml"),
+            ("markdownlint", ".markdownlintrc"),
+        ],
+    )
+    def test_linter_configs_contain(
+        self,
+        all_linter_configs: Mapping[str, tuple[str, ...]],
+        linter: str,
+        expected: str,
+    ) -> None:
+        """Each linter lists its dedicated files and shared sections."""
+        assert expected in all_linter_configs[linter]
 
     def test_results_sorted_by_linter(self) -> None:
         """Results are sorted alphabetically by linter name."""
-        result = get_config_files_for_linters(
-            frozenset({"yamllint", "mypy", "pylint"})
-        )
+        result = get_config_files_for_linters(PYLINT_MYPY_YAMLLINT)
         linter_order = list(result.keys())
         assert linter_order == ["mypy", "pylint", "yamllint"]
 
-    def test_dedicated_files_sorted(self) -> None:
+    def test_dedicated_files_sorted(
+        self, all_linter_configs: Mapping[str, tuple[str, ...]]
+    ) -> None:
         """Dedicated config files are sorted alphabetically."""
-        result = get_config_files_for_linters(frozenset({"pylint"}))
-        dedicated = [f for f in result["pylint"] if "in" not in f]
-        assert dedicated == sorted(dedicated)
-
-    def test_linter_without_shared_has_dedicated(self) -> None:
-        """Linter with only dedicated files includes them."""
-        result = get_config_files_for_linters(
-            frozenset({"yamllint"})
-        )
-        assert ".yamllint" in result["yamllint"]
+        dedicated = [
+            f for f in all_linter_configs["pylint"] if not f.startswith("[")
+        ]
+        assert dedicated == [".pylintrc", ".pylintrc.toml", "pylintrc"]
 
-    def test_linter_without_shared_has_pyproject(self) -> None:
-        """Linter with pyproject.toml shared section includes it."""
-        result = get_config_files_for_linters(
-            frozenset({"yamllint"})
-        )
-        assert (
-            "[tool.yamllint.*] in pyproject.toml"
-            in result["yamllint"]
-        )
+    def test_config_files_are_tuples(
+        self, all_linter_configs: Mapping[str, tuple[str, ...]]
+    ) -> None:
+        """Config file descriptions are returned as immutable tuples."""
+        assert isinstance(all_linter_configs["pylint"], tuple)
 
-    def test_all_valid_linters_returns_correct_count(self) -> None:
+    def test_repeated_call_returns_cached_result(self) -> None:
+        """Repeated calls with the same linter set share one result."""
+        first = get_config_files_for_linters(PYLINT_ONLY)
+        assert get_config_files_for_linters(PYLINT_ONLY) is first
+
+    def test_result_is_read_only(self) -> None:
+        """The cached result cannot be mutated by callers."""
+        result = get_config_files_for_linters(PYLINT_ONLY)
+        assert isinstance(result, MappingProxyType)
+
+    def test_all_valid_linters_returns_correct_count(
+        self, all_linter_configs: Mapping[str, tuple[str, ...]]
+    ) -> None:
         """All valid linters return correct number of results."""
-        result = get_config_files_for_linters(VALID_LINTERS)
-        assert len(result) == len(VALID_LINTERS)
+        assert len(all_linter_configs) == len(VALID_LINTERS)
 
-    @pytest.mark.parametrize(
-        "linter",
-        sorted(VALID_LINTERS),
-    )
     def test_each_valid_linter_has_configs(
-        self, linter: str
+        self, all_linter_configs: Mapping[str, tuple[str, ...]]
     ) -> None:
         """Each valid linter returns non-empty config list."""
-        result = get_config_files_for_linters(VALID_LINTERS)
-        assert len(result[linter]) > 0
-
-
-@pytest.mark.unit
-class TestGetConfigFilesForMarkdownlint:
-    """Tests for get_config_files_for_linters with markdownlint."""
-
-    def test_markdownlint_contains_key(self) -> None:
-        """Markdownlint result contains markdownlint key."""
-        result = get_config_files_for_linters(
-            frozenset({"markdownlint"})
-        )
-        assert "markdownlint" in result
-
-    def test_markdownlint_contains_json(self) -> None:
-        """Markdownlint result contains .markdownlint.json."""
-        result = get_config_files_for_linters(
-            frozenset({"markdownlint"})
-        )
-        assert ".markdownlint.json" in result["markdownlint"]
-
-    def test_markdownlint_contains_jsonc(self) -> None:
-        """Markdownlint result contains .markdownlint.jsonc."""
-        result = get_config_files_for_linters(
-            frozenset({"markdownlint"})
-        )
-        assert ".markdownlint.jsonc" in result["markdownlint"]
-
-    def test_markdownlint_contains_yml(self) -> None:
-        """Markdownlint result contains .markdownlint.yml."""
-        result = get_config_files_for_linters(
-            frozenset({"markdownlint"})
-        )
-        assert ".markdownlint.yml" in result["markdownlint"]
-
-    def test_markdownlint_contains_yaml(self) -> None:
-        """Markdownlint result contains .markdownlint.yaml."""
-        result = get_config_files_for_linters(
-            frozenset({"markdownlint"})
-        )
-        assert ".markdownlint.yaml" in result["markdownlint"]
-
-    def test_markdownlint_contains_rc(self) -> None:
-        """Markdownlint result contains .markdownlintrc."""
-        result = get_config_files_for_linters(
-            frozenset({"markdownlint"})
-        )
-        assert ".markdownlintrc" in result["markdownlint"]
+        empty = [
+            linter for linter in sorted(VALID_LINTERS)
+            if not all_linter_configs[linter]
+        ]
+        assert empty == []
 
 
 @pytest.mark.unit
@@ -273,47 +199,31 @@ class TestSharedConfigSectionsMapping:
 
     @pytest.mark.parametrize(
         "linter",
-        list(SHARED_CONFIG_SECTIONS.keys()),
+        sorted(SHARED_CONFIG_SECTIONS),
     )
     def test_linter_has_pyproject_section(self, linter: str) -> None:
         """Linter in SHARED_CONFIG_SECTIONS has pyproject.toml."""
         assert "pyproject.toml" in SHARED_CONFIG_SECTIONS[linter]
 
-    def test_pylint_has_pyproject(self) -> None:
-        """Pylint has pyproject.toml shared section."""
-        assert "pyproject.toml" in SHARED_CONFIG_SECTIONS["pylint"]
-
-    def test_pylint_has_setup_cfg(self) -> None:
-        """Pylint has setup.cfg shared section."""
-        assert "setup.cfg" in SHARED_CONFIG_SECTIONS["pylint"]
-
-    def test_pylint_has_tox_ini(self) -> None:
-        """Pylint has tox.ini shared section."""
-        assert "tox.ini" in SHARED_CONFIG_SECTIONS["pylint"]
-
-    def test_mypy_has_pyproject(self) -> None:
-        """Mypy has pyproject.toml shared section."""
-        assert "pyproject.toml" in SHARED_CONFIG_SECTIONS["mypy"]
-
-    def test_mypy_has_setup_cfg(self) -> None:
-        """Mypy has setup.cfg shared section."""
-        assert "setup.cfg" in SHARED_CONFIG_SECTIONS["mypy"]
-
-    def test_mypy_has_tox_ini(self) -> None:
-        """Mypy has tox.ini shared section."""
-        assert "tox.ini" in SHARED_CONFIG_SECTIONS["mypy"]
-
-    def test_pytest_has_pyproject(self) -> None:
-        """Pytest has pyproject.toml shared section."""
-        assert "pyproject.toml" in SHARED_CONFIG_SECTIONS["pytest"]
-
-    def test_pytest_has_setup_cfg(self) -> None:
-        """Pytest has setup.cfg shared section."""
-        assert "setup.cfg" in SHARED_CONFIG_SECTIONS["pytest"]
+    @pytest.mark.parametrize(
+        "linter,filename",
+        list(
+            itertools.product(
+                ["pylint", "mypy", "pytest"],
+                ["pyproject.toml", "setup.cfg", "tox.ini"],
+            )
+        ),
+    )
+    def test_linter_has_section(self, linter: str, filename: str) -> None:
+        """Pylint, mypy, and pytest have sections in every shared file."""
+        assert filename in SHARED_CONFIG_SECTIONS[linter]
 
-    def test_pytest_has_tox_ini(self) -> None:
-        """Pytest has tox.ini shared section."""
-        assert "tox.ini" in SHARED_CONFIG_SECTIONS["pytest"]
+    def test_mappings_are_read_only(self) -> None:
+        """The section table and each per-linter table are read-only."""
+        assert all(
+            isinstance(m, MappingProxyType)
+            for m in (SHARED_CONFIG_SECTIONS, *SHARED_CONFIG_SECTIONS.values())
+        )
 
 
 @pytest.mark.unit
@@ -323,22 +233,32 @@ class TestParseLinters:
     def test_single_linter(self) -> None:
         """Parse a single linter."""
         result = parse_linters("pylint")
-        assert result == frozenset({"pylint"})
+        assert result == PYLINT_ONLY
 
     def test_multiple_linters(self) -> None:
         """Parse comma-separated linters."""
         result = parse_linters("pylint,mypy,pytest")
-        assert result == frozenset({"pylint", "mypy", "pytest"})
+        assert result == PYLINT_MYPY_PYTEST
 
     def test_linters_with_spaces(self) -> None:
         """Parse linters with surrounding spaces."""
         result = parse_linters(" pylint , mypy ")
-        assert result == frozenset({"pylint", "mypy"})
+        assert result == PYLINT_AND_MYPY
+
+    def test_linters_with_non_ascii_spaces(self) -> None:
+        """Non-breaking spaces around a linter name are stripped."""
+        result = parse_linters("pylint,\xa0mypy\xa0")
+        assert result == PYLINT_AND_MYPY
+
+    def test_internal_space_raises(self) -> None:
+        """Whitespace inside a linter name is not removed."""
+        with pytest.raises(ValueError, match="Invalid linter"):
+            parse_linters("py lint")
 
     def test_case_insensitive(self) -> None:
         """Linter names are case-insensitive."""
         result = parse_linters("PYLINT,MyPy")
-        assert result == frozenset({"pylint", "mypy"})
+        assert result == PYLINT_AND_MYPY
 
     def test_invalid_linter_raises(self) -> None:
         """Invalid linter raises ValueError."""
@@ -396,368 +316,281 @@ class TestFindingToDict:
         assert result["reason"] == "tool.mypy section"
 
 
+FILTER_TREE_FILES: dict[str, str] = {
+    ".pylintrc": "",
+    "mypy.ini": "",
+    "pytest.ini": "",
+    ".yamllint": "",
+    "pyproject.toml": TOOL_MYPY_TOML + TOOL_PYLINT_TOML,
+    "vendor/.pylintrc": "",
+    "lib/.pylintrc": "",
+    "external/mypy.ini": "",
+}
+
+
+@pytest.fixture(scope="class", name="filter_tree")
+def shared_filter_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build one tree of config files shared by the filter tests."""
+    root = tmp_path_factory.mktemp("filters")
+    for relpath, content in FILTER_TREE_FILES.items():
+        path = root / relpath
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+def _scan_pairs(
+    root: Path,
+    linters: frozenset[str] | None = None,
+    exclude_patterns: list[str] | None = None,
+) -> list[tuple[str, str]]:
+    """Scan root and return sorted (relative path, tool) pairs."""
+    findings = scan_directory(root, linters, exclude_patterns)
+    return sorted(
+        (Path(f.path).relative_to(root).as_posix(), f.tool)
+        for f in findings
+    )
+
+
 @pytest.mark.unit
 class TestScanDirectoryWithFilters:
     """Tests for scan_directory with linters and exclude filters."""
 
-    def test_filter_by_single_linter_returns_one(
-        self, tmp_path: Path
+    def test_filter_by_single_linter(self, filter_tree: Path) -> None:
+        """Filter by a single linter reports only that linter."""
+        assert _scan_pairs(filter_tree, PYLINT_ONLY) == [
+            (".pylintrc", "pylint"),
+            ("lib/.pylintrc", "pylint"),
+            ("pyproject.toml", "pylint"),
+            ("vendor/.pylintrc", "pylint"),
+        ]
+
+    def test_filter_by_multiple_linters(self, filter_tree: Path) -> None:
+        """Filter by multiple linters reports only those linters."""
+        assert _scan_pairs(filter_tree, PYLINT_AND_MYPY) == [
+            (".pylintrc", "pylint"),
+            ("external/mypy.ini", "mypy"),
+            ("lib/.pylintrc", "pylint"),
+            ("mypy.ini", "mypy"),
+            ("pyproject.toml", "mypy"),
+            ("pyproject.toml", "pylint"),
+            ("vendor/.pylintrc", "pylint"),
+        ]
+
+    def test_exclude_pattern(self, filter_tree: Path) -> None:
+        """Paths matching an exclude pattern are skipped."""
+        assert _scan_pairs(filter_tree, PYLINT_ONLY, ["*vendor*"]) == [
+            (".pylintrc", "pylint"),
+            ("lib/.pylintrc", "pylint"),
+            ("pyproject.toml", "pylint"),
+        ]
+
+    def test_exclude_multiple_patterns(self, filter_tree: Path) -> None:
+        """Paths matching any of several exclude patterns are skipped."""
+        pairs = _scan_pairs(
+            filter_tree, exclude_patterns=["*lib*", "*external*"]
+        )
+        assert pairs == [
+            (".pylintrc", "pylint"),
+            (".yamllint", "yamllint"),
+            ("mypy.ini", "mypy"),
+            ("pyproject.toml", "mypy"),
+            ("pyproject.toml", "pylint"),
+            ("pytest.ini", "pytest"),
+            ("vendor/.pylintrc", "pylint"),
+        ]
+
+    def test_exclude_file_pattern(self, filter_tree: Path) -> None:
+        """A pattern without a trailing '*' excludes matching files only."""
+        pairs = _scan_pairs(filter_tree, PYLINT_ONLY, ["*/.pylintrc"])
+        assert pairs == [("pyproject.toml", "pylint")]
+
+    def test_directory_without_trailing_star_not_pruned(
+        self, filter_tree: Path
     ) -> None:
-        """Filter by a single linter returns one finding."""
-        (tmp_path / ".pylintrc").touch()
-        (tmp_path / "mypy.ini").touch()
-        findings = scan_directory(
-            tmp_path, linters=frozenset({"pylint"})
-        )
-        assert len(findings) == 1
+        """A pattern matching only the directory path keeps its files."""
+        pairs = _scan_pairs(filter_tree, PYLINT_ONLY, ["*/vendor"])
+        assert ("vendor/.pylintrc", "pylint") in pairs
 
-    def test_filter_by_single_linter_has_correct_tool(
-        self, tmp_path: Path
+    def test_excluded_directory_not_walked(
+        self, filter_tree: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Filter by a single linter reports the correct tool."""
-        (tmp_path / ".pylintrc").touch()
-        (tmp_path / "mypy.ini").touch()
-        findings = scan_directory(
-            tmp_path, linters=frozenset({"pylint"})
-        )
-        assert findings[0].tool == "pylint"
+        """Directories covered by a trailing-'*' pattern are not descended."""
+        visited: list[str] = []
+        real_walk = os.walk
 
-    def test_filter_by_multiple_linters_returns_correct(
-        self, tmp_path: Path
-    ) -> None:
-        """Filter by multiple linters returns correct count."""
-        (tmp_path / ".pylintrc").touch()
-        (tmp_path / "mypy.ini").touch()
-        (tmp_path / "pytest.ini").touch()
-        findings = scan_directory(
-            tmp_path, linters=frozenset({"pylint", "mypy"})
-        )
-        assert len(findings) == 2
+        def recording_walk(top: Path) -> Iterator[
+            tuple[str, list[str], list[str]]
+        ]:
+            for entry in real_walk(top):
+                visited.append(Path(entry[0]).name)
+                yield entry
 
-    def test_filter_by_multiple_linters_has_correct_tools(
-        self, tmp_path: Path
-    ) -> None:
-        """Filter by multiple linters reports the correct tools."""
-        (tmp_path / ".pylintrc").touch()
-        (tmp_path / "mypy.ini").touch()
-        (tmp_path / "pytest.ini").touch()
-        findings = scan_directory(
-            tmp_path, linters=frozenset({"pylint", "mypy"})
-        )
-        linters_found = {f.tool for f in findings}
-        assert linters_found == {"pylint", "mypy"}
+        monkeypatch.setattr(os, "walk", recording_walk)
+        scan_directory(filter_tree, exclude_patterns=["*vendor*", "*lib*"])
+        assert sorted(visited[1:]) == ["external"]
 
-    def test_exclude_pattern_returns_one_finding(
-        self, tmp_path: Path
-    ) -> None:
-        """Exclude paths matching pattern returns one finding."""
-        subdir = tmp_path / "vendor"
-        subdir.mkdir()
-        (subdir / ".pylintrc").touch()
-        (tmp_path / "mypy.ini").touch()
-        findings = scan_directory(
-            tmp_path,
-            linters=VALID_LINTERS,
-            exclude_patterns=["*vendor*"],
-        )
-        assert len(findings) == 1
+    def test_filter_embedded_config(self, filter_tree: Path) -> None:
+        """Filtering keeps only the selected section of pyproject.toml."""
+        pairs = _scan_pairs(filter_tree, MYPY_ONLY)
+        assert [t for p, t in pairs if p == "pyproject.toml"] == ["mypy"]
 
-    def test_exclude_pattern_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Exclude paths matching pattern reports correct tool."""
-        subdir = tmp_path / "vendor"
-        subdir.mkdir()
-        (subdir / ".pylintrc").touch()
-        (tmp_path / "mypy.ini").touch()
-        findings = scan_directory(
-            tmp_path,
-            linters=VALID_LINTERS,
-            exclude_patterns=["*vendor*"],
-        )
-        assert findings[0].tool == "mypy"
-
-    @pytest.fixture
-    def exclude_multiple_findings(
-        self, tmp_path: Path
-    ) -> list[Finding]:
-        """Scan with multiple exclude patterns on lib and external."""
-        lib_dir = tmp_path / "lib"
-        ext_dir = tmp_path / "external"
-        lib_dir.mkdir()
-        ext_dir.mkdir()
-        (lib_dir / ".pylintrc").touch()
-        (ext_dir / "mypy.ini").touch()
-        (tmp_path / ".yamllint").touch()
-        return scan_directory(
-            tmp_path,
-            linters=VALID_LINTERS,
-            exclude_patterns=["*lib*", "*external*"],
-        )
 
-    def test_exclude_multiple_patterns_returns_one(
-        self, exclude_multiple_findings: list[Finding]
-    ) -> None:
-        """Multiple exclude patterns return one finding."""
-        assert len(exclude_multiple_findings) == 1
+@pytest.mark.unit
+class TestCompileExcludePatterns:
+    """Tests for the _compile_exclude_patterns helper."""
 
-    def test_exclude_multiple_patterns_has_correct_tool(
-        self, exclude_multiple_findings: list[Finding]
-    ) -> None:
-        """Multiple exclude patterns report the correct tool."""
-        assert exclude_multiple_findings[0].tool == "yamllint"
+    def test_no_patterns_returns_none(self) -> None:
+        """An empty pattern tuple compiles to no matcher."""
+        assert _compile_exclude_patterns(()) is None
 
-    def test_filter_embedded_config_returns_one(
-        self, tmp_path: Path, pyproject_mypy_pylint_content: str
-    ) -> None:
-        """Filter embedded config returns one finding."""
-        (tmp_path / "pyproject.toml").write_text(
-            pyproject_mypy_pylint_content
-        )
-        findings = scan_directory(
-            tmp_path, linters=frozenset({"mypy"})
-        )
-        assert len(findings) == 1
+    def test_repeated_patterns_share_compiled_regex(self) -> None:
+        """The same pattern tuple is compiled only once."""
+        first = _compile_exclude_patterns(("*vendor*", "*lib*"))
+        assert _compile_exclude_patterns(("*vendor*", "*lib*")) is first
 
-    def test_filter_embedded_config_has_correct_tool(
-        self, tmp_path: Path, pyproject_mypy_pylint_content: str
-    ) -> None:
-        """Filter embedded config reports the correct tool."""
-        (tmp_path / "pyproject.toml").write_text(
-            pyproject_mypy_pylint_content
-        )
-        findings = scan_directory(
-            tmp_path, linters=frozenset({"mypy"})
-        )
-        assert findings[0].tool == "mypy"
+    def test_matches_any_pattern(self) -> None:
+        """The combined regex matches paths for any of the globs."""
+        matcher = _compile_exclude_patterns(("*vendor*", "*lib*"))
+        assert [
+            bool(matcher and matcher.match(p))
+            for p in ("a/vendor/x", "a/lib/y", "a/src/z")
+        ] == [True, True, False]
 
 
 @pytest.mark.unit
-class TestPyprojectRegexFallbackDetection:
-    """Tests for the regex fallback detection of tool sections."""
-
-    def test_regex_detects_pylint_returns_one(
-        self, tmp_path: Path
-    ) -> None:
-        """Regex fallback detects [tool.pylint] returns one."""
-        content = "[tool.pylint]\nmax-line-length = 100\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert len(findings) == 1
-
-    def test_regex_detects_pylint_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Regex fallback detects [tool.pylint] reports pylint."""
-        content = "[tool.pylint]\nmax-line-length = 100\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert findings[0].tool == "pylint"
-
-    def test_regex_detects_mypy_returns_one(
-        self, tmp_path: Path
-    ) -> None:
-        """Regex fallback detects [tool.mypy] returns one."""
-        content = "[tool.mypy]\nstrict = true\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert len(findings) == 1
+class TestPyprojectHeaderFallback:
+    """Tests for the header-prefix fallback used when tomllib cannot parse."""
 
-    def test_regex_detects_mypy_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Regex fallback detects [tool.mypy] reports mypy."""
-        content = "[tool.mypy]\nstrict = true\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert findings[0].tool == "mypy"
-
-    def test_regex_detects_pytest_returns_one(
-        self, tmp_path: Path
+    @pytest.mark.parametrize(
+        "content,expected_tools",
+        [
+            (TOOL_PYLINT_TOML, ["pylint"]),
+            (TOOL_MYPY_TOML, ["mypy"]),
+            (TOOL_PYTEST_TOML, ["pytest"]),
+            (TOOL_JSCPD_TOML, ["jscpd"]),
+            (TOOL_YAMLLINT_TOML, ["yamllint"]),
+            ("[tool.black]\nline-length = 88\n", []),
+            ('x = "[tool.mypy]"\n# [tool.pylint]\n', []),
+            ("[tool." + "a" * 100_000, []),
+        ],
+        ids=[
+            "pylint", "mypy", "pytest", "jscpd", "yamllint",
+            "unrelated", "not-line-start", "pathological",
+        ],
+    )
+    def test_detects_tool_sections(
+        self, content: str, expected_tools: list[str]
     ) -> None:
-        """Regex fallback detects [tool.pytest.ini_options]."""
-        content = "[tool.pytest.ini_options]\naddopts = '-v'\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert len(findings) == 1
+        """Fallback reports exactly the tools whose headers start a line."""
+        findings = _check_pyproject_headers("pyproject.toml", content)
+        assert [f.tool for f in findings] == expected_tools
 
-    def test_regex_detects_pytest_has_correct_tool(
-        self, tmp_path: Path
+    @pytest.mark.parametrize(
+        "use_tomllib,content,expected_tool",
+        [
+            (True, INVALID_MYPY_TOML, "mypy"),
+            (False, TOOL_PYLINT_TOML, "pylint"),
+        ],
+        ids=["tomllib-parse-error", "no-tomllib"],
+    )
+    def test_check_pyproject_falls_back_to_headers(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        use_tomllib: bool,
+        content: str,
+        expected_tool: str,
     ) -> None:
-        """Regex fallback detects pytest reports pytest."""
-        content = "[tool.pytest.ini_options]\naddopts = '-v'\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
+        """Unparseable TOML or missing tomllib falls back to header matching."""
+        monkeypatch.setattr(
+            scanner, "HAS_TOMLLIB", scanner.HAS_TOMLLIB and use_tomllib
         )
-        assert findings[0].tool == "pytest"
+        findings = check_pyproject_toml(Path("pyproject.toml"), content)
+        assert [f.tool for f in findings] == [expected_tool]
 
-    def test_regex_detects_jscpd_returns_one(
-        self, tmp_path: Path
-    ) -> None:
-        """Regex fallback detects [tool.jscpd] returns one."""
-        content = "[tool.jscpd]\nthreshold = 0\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert len(findings) == 1
 
-    def test_regex_detects_jscpd_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Regex fallback detects [tool.jscpd] reports jscpd."""
-        content = "[tool.jscpd]\nthreshold = 0\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert findings[0].tool == "jscpd"
+@pytest.mark.unit
+class TestConfigParserErrors:
+    """Tests for configparser error handling."""
 
-    def test_regex_detects_yamllint_returns_one(
-        self, tmp_path: Path
-    ) -> None:
-        """Regex fallback detects [tool.yamllint] returns one."""
-        content = "[tool.yamllint]\nrules = {}\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert len(findings) == 1
+    def test_setup_cfg_invalid_syntax_returns_empty(self) -> None:
+        """Invalid setup.cfg returns no findings."""
+        content = UNCLOSED_HEADER_INI
+        findings = check_setup_cfg(Path("setup.cfg"), content)
+        assert len(findings) == 0
 
-    def test_regex_detects_yamllint_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """Regex fallback detects [tool.yamllint] reports yamllint."""
-        content = "[tool.yamllint]\nrules = {}\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
-        assert findings[0].tool == "yamllint"
+    def test_tox_ini_invalid_syntax_returns_empty(self) -> None:
+        """Invalid tox.ini returns no findings."""
+        content = UNCLOSED_HEADER_INI
+        findings = check_tox_ini(Path("tox.ini"), content)
+        assert len(findings) == 0
 
-    def test_regex_no_findings(self, tmp_path: Path) -> None:
-        """Regex fallback returns empty for non-matching content."""
-        content = "[tool.black]\nline-length = 88\n"
-        findings = _check_pyproject_with_regex(
-            str(tmp_path), content
-        )
+    def test_setup_cfg_invalid_body_returns_empty(self) -> None:
+        """setup.cfg with a linter header but invalid body returns empty."""
+        content = "[mypy]\nnot an option line\n"
+        findings = check_setup_cfg(Path("setup.cfg"), content)
         assert len(findings) == 0
 
+    def test_tox_ini_invalid_body_returns_empty(self) -> None:
+        """tox.ini with a linter header but invalid body returns empty."""
+        content = "[pytest]\nnot an option line\n"
+        findings = check_tox_ini(Path("tox.ini"), content)
+        assert len(findings) == 0
 
-@pytest.mark.unit
-class TestPyprojectRegexFallbackIntegration:
-    """Tests for tomllib failure fallback to regex."""
+    def test_duplicate_section_still_reported(self) -> None:
+        """A repeated linter section is reported once, not swallowed."""
+        content = MYPY_INI + "\n" + MYPY_INI
+        findings = check_setup_cfg(Path("setup.cfg"), content)
+        assert [f.reason for f in findings] == ["mypy section"]
 
-    def test_tomllib_parse_error_returns_one(
-        self, tmp_path: Path
-    ) -> None:
-        """When tomllib fails, regex fallback returns one finding."""
-        content = "[tool.mypy]\nstrict = {\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert len(findings) == 1
 
-    def test_tomllib_parse_error_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """When tomllib fails, regex fallback reports mypy."""
-        content = "[tool.mypy]\nstrict = {\n"
-        findings = check_pyproject_toml(
-            tmp_path / "pyproject.toml", content
-        )
-        assert findings[0].tool == "mypy"
+@pytest.mark.unit
+class TestIniSectionNames:
+    """Tests for the INI section header pre-scan."""
 
-    def test_without_tomllib_returns_one(
-        self, tmp_path: Path
-    ) -> None:
-        """HAS_TOMLLIB=False returns one finding."""
-        content = "[tool.pylint]\nmax-line-length = 100\n"
-        with patch(
-            "assert_no_linter_config_files.scanner.HAS_TOMLLIB",
-            False,
-        ):
-            findings = check_pyproject_toml(
-                tmp_path / "pyproject.toml", content
-            )
-        assert len(findings) == 1
+    def test_yields_headers_in_order(self) -> None:
+        """Section headers are yielded in file order."""
+        content = "[metadata]\nname = x\n\n[mypy]\nstrict = True\n"
+        names = list(_iter_ini_section_names(content))
+        assert names == ["metadata", "mypy"]
 
-    def test_without_tomllib_has_correct_tool(
-        self, tmp_path: Path
-    ) -> None:
-        """HAS_TOMLLIB=False reports pylint tool."""
-        content = "[tool.pylint]\nmax-line-length = 100\n"
-        with patch(
-            "assert_no_linter_config_files.scanner.HAS_TOMLLIB",
-            False,
-        ):
-            findings = check_pyproject_toml(
-                tmp_path / "pyproject.toml", content
-            )
-        assert findings[0].tool == "pylint"
+    def test_yields_indented_header(self) -> None:
+        """Indented headers are yielded like configparser reads them."""
+        names = list(_iter_ini_section_names("  [mypy]\n"))
+        assert names == ["mypy"]
 
+    def test_header_without_trailing_newline(self) -> None:
+        """A header on the final line without a newline is yielded."""
+        names = list(_iter_ini_section_names("[tox]\n[pytest]"))
+        assert names == ["tox", "pytest"]
 
-@pytest.mark.unit
-class TestConfigParserErrors:
-    """Tests for configparser error handling."""
+    def test_header_runs_to_last_bracket(self) -> None:
+        """The header name extends to the last closing bracket."""
+        names = list(_iter_ini_section_names("[a]pylint]\n"))
+        assert names == ["a]pylint"]
 
-    def test_setup_cfg_invalid_syntax_returns_empty(
-        self, tmp_path: Path
-    ) -> None:
-        """Invalid setup.cfg returns no findings."""
-        content = "[section\nmissing closing bracket"
-        findings = check_setup_cfg(tmp_path / "setup.cfg", content)
-        assert len(findings) == 0
+    def test_ignores_brackets_inside_values(self) -> None:
+        """Brackets that do not start a line are not headers."""
+        names = list(_iter_ini_section_names("[tox]\nenvlist = [py3]\n"))
+        assert names == ["tox"]
 
-    def test_tox_ini_invalid_syntax_returns_empty(
-        self, tmp_path: Path
-    ) -> None:
-        """Invalid tox.ini returns no findings."""
-        content = "[section\nmissing closing bracket"
-        findings = check_tox_ini(tmp_path / "tox.ini", content)
-        assert len(findings) == 0
+    def test_ignores_unclosed_header(self) -> None:
+        """A header without a closing bracket is not yielded."""
+        names = list(_iter_ini_section_names("[section\nkey = value\n"))
+        assert not names
 
 
 @pytest.mark.unit
 def test_unknown_filename_returns_empty(tmp_path: Path) -> None:
-    """Unknown config file returns empty list."""
-    unknown_file = tmp_path / "unknown.txt"
-    unknown_file.write_text("content")
+    """Unknown file names return no findings without being read."""
+    missing_file = tmp_path / "unknown.txt"
     findings = _process_shared_config_file(
-        unknown_file, "unknown.txt"
+        missing_file, "unknown.txt"
     )
     assert len(findings) == 0
 
 
 @pytest.mark.unit
-def test_has_tomllib_false_when_import_fails() -> None:
-    """HAS_TOMLLIB is False when tomllib import fails."""
-    original_import = builtins.__import__
-
-    def mock_import(name, *args, **kwargs):
-        if name == "tomllib":
-            raise ImportError("No module named 'tomllib'")
-        return original_import(name, *args, **kwargs)
-
-    scanner_module = "assert_no_linter_config_files.scanner"
-    if scanner_module in sys.modules:
-        del sys.modules[scanner_module]
-    if "tomllib" in sys.modules:
-        saved_tomllib = sys.modules["tomllib"]
-        del sys.modules["tomllib"]
-    else:
-        saved_tomllib = None
-
-    try:
-        with patch.object(
-            builtins, "__import__", side_effect=mock_import
-        ):
-            mod = importlib.import_module(scanner_module)
-        assert mod.HAS_TOMLLIB is False
-    finally:
-        if saved_tomllib is not None:
-            sys.modules["tomllib"] = saved_tomllib
-        if scanner_module in sys.modules:
-            del sys.modules[scanner_module]
-        importlib.import_module(scanner_module)
+def test_detect_tomllib_false_when_module_missing() -> None:
+    """_detect_tomllib returns False when the finder locates nothing."""
+    assert _detect_tomllib(lambda name: None) is False